@@ -1,14 +1,20 @@
 import argparse
+import atexit
+import io
 import itertools
 import json
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import cache
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -16,13 +22,52 @@ import httpx
 from dotenv import load_dotenv
 from github import Github
 from github.Artifact import Artifact
+from github.GithubException import GithubException
 from github.PaginatedList import PaginatedList
+from github.Repository import Repository
+from github.Workflow import Workflow
+from github.WorkflowRun import WorkflowRun
 from rich.console import Console
-from rich.progress import track
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    TaskProgressColumn,
+    TextColumn,
+    TransferSpeedColumn,
+)
 
 console = Console()
 
 
+def _dump_metadata(data: dict[str, object]) -> bytes:
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+# Chunk size for streaming artifact downloads. Small chunks (the httpx default)
+# pay a Python-level iteration, a write syscall and a progress tick per chunk;
+# 1 MiB keeps that overhead negligible for multi-hundred-MB artifacts.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Archives up to this size are buffered in memory instead of hitting disk;
+# larger ones spill to a real temporary file automatically.
+SPOOL_MAX_SIZE = 256 << 20
+
+# The pixi binary at the archive root or in any subdirectory.
+_PIXI_BINARY_RE = re.compile(r"(?:^|/)pixi(?:\.exe)?$")
+
+
+@cache
+def http_client() -> httpx.Client:
+    """Shared HTTP client so repeated downloads reuse one TCP+TLS connection."""
+    client = httpx.Client(
+        follow_redirects=True,
+        timeout=httpx.Timeout(30.0, read=60.0),
+    )
+    atexit.register(client.close)
+    return client
+
+
 @dataclass(frozen=True)
 class ArtifactTarget:
     # Repo the target is located in
@@ -33,6 +78,7 @@ class ArtifactTarget:
     pr_number: str | None
 
 
+@cache
 def get_current_platform() -> str:
     """Get the current platform string for pixi artifact naming."""
     system = platform.system().lower()
@@ -55,6 +101,128 @@ def get_current_platform() -> str:
     raise ValueError(f"Unsupported platform: {system}-{machine}")
 
 
+@cache
+def artifact_pattern(repo: str) -> str:
+    """Platform-specific artifact name pattern for a repository."""
+    current_platform = get_current_platform()
+    if repo.endswith("/pixi"):
+        return f"pixi-{current_platform}"
+    if repo.endswith("/pixi-build-backends"):
+        return f"pixi-build-backends-{current_platform}"
+    raise ValueError(f"Unsupported repository: {repo}")
+
+
+# Workflow file names for the workflows referenced by ArtifactTarget; fetching
+# by file name is a single API request instead of paginating every workflow.
+WORKFLOW_FILES = {
+    "CI": "ci.yml",
+    "Testsuite": "testsuite.yml",
+}
+
+# Workflow IDs resolved on earlier runs, keyed by "repo:workflow name".
+_WORKFLOW_CACHE_PATH = Path("artifacts") / ".workflow-cache.json"
+_WORKFLOW_CACHE_LOCK = threading.Lock()
+
+
+def _load_workflow_cache() -> dict[str, int]:
+    try:
+        data = json.loads(_WORKFLOW_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return {key: value for key, value in data.items() if isinstance(value, int)}
+
+
+def _store_workflow_id(key: str, workflow_id: int) -> None:
+    with _WORKFLOW_CACHE_LOCK:
+        cached = _load_workflow_cache()
+        cached[key] = workflow_id
+        try:
+            _WORKFLOW_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _WORKFLOW_CACHE_PATH.with_name(_WORKFLOW_CACHE_PATH.name + ".tmp")
+            tmp_path.write_text(json.dumps(cached), encoding="utf-8")
+            os.replace(tmp_path, _WORKFLOW_CACHE_PATH)
+        except OSError:
+            # The cache is an optimization only; never fail a download over it.
+            pass
+
+
+def resolve_workflow(repository: Repository, workflow: str) -> Workflow:
+    """Resolve a workflow by cached ID or file name, scanning only as fallback."""
+    cache_key = f"{repository.full_name}:{workflow}"
+    cached_id = _load_workflow_cache().get(cache_key)
+    if cached_id is not None:
+        try:
+            return repository.get_workflow(cached_id)
+        except GithubException:
+            console.print("[yellow]Cached workflow ID is stale; resolving again")
+
+    file_name = WORKFLOW_FILES.get(workflow)
+    if file_name is not None:
+        try:
+            resolved = repository.get_workflow(file_name)
+        except GithubException:
+            console.print(f"[yellow]Workflow file '{file_name}' not found; scanning workflows")
+        else:
+            _store_workflow_id(cache_key, resolved.id)
+            return resolved
+
+    for wf in repository.get_workflows():
+        if wf.name == workflow:
+            _store_workflow_id(cache_key, wf.id)
+            return wf
+
+    console.print(f"[red]Could not find workflow: {workflow}")
+    raise ValueError(f"Could not find workflow: {workflow}")
+
+
+def _extract_member(
+    zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo, dest: Path, executable: bool = False
+) -> None:
+    """
+    Extract one member to an exact destination path.
+
+    Sizing the copy buffer to the member (capped at the download chunk size)
+    skips the extra buffering layers and small default chunks of
+    ``ZipFile.extract`` and never writes to an intermediate location. With
+    ``executable`` the mode is set through the open descriptor, saving a
+    separate chmod on the final path.
+    """
+    if member.file_size == 0:
+        dest.touch()
+        return
+    with zip_ref.open(member) as src, open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst, min(member.file_size, DOWNLOAD_CHUNK_SIZE))
+        if executable and not sys.platform.startswith("win"):
+            os.fchmod(dst.fileno(), 0o755)
+
+
+def extract_channel_parallel(data: bytes, members: list[zipfile.ZipInfo], dest: Path) -> None:
+    """
+    Extract archive members into ``dest`` across several threads.
+
+    DEFLATE decompression releases the GIL, so splitting the members over a
+    few workers scales with cores. Each worker gets its own ``ZipFile`` handle
+    because a shared handle is not safe for concurrent reads.
+    """
+    # Create all directories up front so the workers never race in makedirs.
+    for member in members:
+        target = dest / member.filename
+        (target if member.is_dir() else target.parent).mkdir(parents=True, exist_ok=True)
+
+    file_members = [member for member in members if not member.is_dir()]
+    workers = min(os.cpu_count() or 1, 4, len(file_members)) or 1
+    slices = [file_members[index::workers] for index in range(workers)]
+
+    def extract_slice(slice_members: list[zipfile.ZipInfo]) -> None:
+        with zipfile.ZipFile(io.BytesIO(data), "r") as zip_ref:
+            for member in slice_members:
+                _extract_member(zip_ref, member, dest.joinpath(member.filename))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(extract_slice, s) for s in slices if s]:
+            future.result()
+
+
 def download_and_extract_artifact(
     target_artifact: Artifact, github_token: str | None, output_dir: Path, repo: str
 ) -> None:
@@ -68,114 +236,119 @@ def download_and_extract_artifact(
     if github_token:
         headers["Authorization"] = f"token {github_token}"
 
-    with httpx.stream(
-        "GET", download_url, headers=headers, follow_redirects=True, timeout=30.0
-    ) as response:
-        response.raise_for_status()
+    # Buffer the archive in memory (spilling to disk past SPOOL_MAX_SIZE) and
+    # extract straight from the buffer, avoiding a write/reread round-trip.
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, suffix=".zip") as temp_file:
+        with http_client().stream("GET", download_url, headers=headers) as response:
+            response.raise_for_status()
 
-        # Save to temporary file and extract
-        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as temp_file:
             total_size = int(response.headers.get("content-length", 0))
 
-            if total_size > 0:
-                for chunk in track(
-                    response.iter_bytes(chunk_size=8192),
-                    total=total_size // 8192,
-                    description="Downloading...",
-                ):
-                    temp_file.write(chunk)
-            else:
-                for chunk in response.iter_bytes(chunk_size=8192):
+            # iter_raw skips httpx's content-decoding layer; artifact zips are
+            # served without content-encoding, so the bytes are identical.
+            # Progress tracks bytes rather than chunks and is disabled outside
+            # a terminal, so its refresh-rate-limited redraws cost nothing in
+            # CI logs and almost nothing locally.
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                DownloadColumn(),
+                TransferSpeedColumn(),
+                console=console,
+                disable=not (total_size > 0 and console.is_terminal),
+            ) as progress:
+                task = progress.add_task("Downloading...", total=total_size or None)
+                for chunk in response.iter_raw(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     temp_file.write(chunk)
+                    progress.advance(task, len(chunk))
 
-            temp_zip_path = temp_file.name
-
-    console.print("[blue]Extracting artifact...")
-
-    # Extract the zip file
-    with zipfile.ZipFile(temp_zip_path, "r") as zip_ref:
-        # List contents
-        file_list = zip_ref.namelist()
-        console.print(f"[blue]Archive contents: {file_list}")
-
-        if repo == "prefix-dev/pixi":
-            # Find the pixi binary
-            pixi_binary = None
-            for file_name in file_list:
-                if (
-                    file_name == "pixi"
-                    or file_name.endswith("/pixi")
-                    or file_name.endswith("pixi.exe")
-                ):
-                    pixi_binary = file_name
-                    break
-
-            if not pixi_binary:
-                console.print("[red]Could not find pixi binary in archive")
-                raise FileNotFoundError(
-                    f"Could not find pixi binary in archive. Archive contents: {file_list}"
-                )
-
-            final_path = output_dir / Path(pixi_binary).name
-            if final_path.exists():
-                if final_path.is_dir():
-                    shutil.rmtree(final_path)
-                else:
-                    final_path.unlink()
-
-            # Extract the binary
-            zip_ref.extract(pixi_binary, output_dir)
+        temp_file.seek(0)
 
-            # Move to correct location if it was in a subdirectory
-            extracted_path = output_dir / pixi_binary
+        console.print("[blue]Extracting artifact...")
 
-            if extracted_path != final_path:
-                extracted_path.rename(final_path)
+        # Extract the zip file
+        with zipfile.ZipFile(temp_file, "r") as zip_ref:
+            # The central directory is already parsed; reuse the member list
+            # everywhere instead of materializing name lists to rescan.
+            members = zip_ref.infolist()
+            console.print(f"[blue]Archive contains {len(members)} entries")
 
-            # Make executable on Unix systems
-            if not sys.platform.startswith("win"):
-                final_path.chmod(0o755)
-
-            console.print(f"[green]Successfully downloaded pixi binary to: {final_path}")
-
-        elif repo == "prefix-dev/pixi-build-backends":
-            # Find the pixi binary
-            is_channel = None
-            for file_name in file_list:
-                if file_name.endswith("repodata.json"):
-                    is_channel = True
-                    break
-
-            if not is_channel:
-                console.print("[red]Could not locate a channel directory inside the artifact.")
-                raise FileNotFoundError("Could not locate a channel directory inside the artifact.")
-
-            console.print("[blue]Detected backend channel artifact")
-            final_channel_path = output_dir / "pixi-build-backends"
-            if final_channel_path.exists():
-                console.print(f"[yellow]Removing existing channel at {final_channel_path}")
-                shutil.rmtree(final_channel_path)
-
-            final_channel_path.parent.mkdir(parents=True, exist_ok=True)
-            zip_ref.extractall(final_channel_path)
+            if repo == "prefix-dev/pixi":
+                # Find the pixi binary
+                pixi_member = next(
+                    (member for member in members if _PIXI_BINARY_RE.search(member.filename)),
+                    None,
+                )
 
-            console.print(f"[green]Channel is ready at: {final_channel_path}")
-        else:
-            raise ValueError(f"Unsupported repository: {repo}")
+                if pixi_member is None:
+                    file_list = [member.filename for member in members]
+                    console.print("[red]Could not find pixi binary in archive")
+                    raise FileNotFoundError(
+                        f"Could not find pixi binary in archive. Archive contents: {file_list}"
+                    )
+
+                final_path = output_dir / Path(pixi_member.filename).name
+                if final_path.exists():
+                    if final_path.is_dir():
+                        shutil.rmtree(final_path)
+                    else:
+                        final_path.unlink()
+
+                # Stream the member straight to its flat final path; extract()
+                # would recreate the member's directory structure inside
+                # output_dir and require a rename afterwards.
+                _extract_member(zip_ref, pixi_member, final_path, executable=True)
+
+                console.print(f"[green]Successfully downloaded pixi binary to: {final_path}")
+
+            elif repo == "prefix-dev/pixi-build-backends":
+                # A channel artifact is recognized by its repodata.json
+                is_channel = any(member.filename.endswith("repodata.json") for member in members)
+
+                if not is_channel:
+                    console.print("[red]Could not locate a channel directory inside the artifact.")
+                    raise FileNotFoundError(
+                        "Could not locate a channel directory inside the artifact."
+                    )
+
+                console.print("[blue]Detected backend channel artifact")
+                final_channel_path = output_dir / "pixi-build-backends"
+                if final_channel_path.exists():
+                    console.print(f"[yellow]Removing existing channel at {final_channel_path}")
+                    shutil.rmtree(final_channel_path)
+
+                final_channel_path.parent.mkdir(parents=True, exist_ok=True)
+
+                if 0 < total_size <= SPOOL_MAX_SIZE and len(members) > 1:
+                    # The archive is already fully buffered in memory, so the
+                    # workers can each wrap the same bytes in a fresh handle.
+                    temp_file.seek(0)
+                    extract_channel_parallel(temp_file.read(), members, final_channel_path)
+                else:
+                    zip_ref.extractall(final_channel_path)
 
-    # Clean up temporary file
-    os.unlink(temp_zip_path)
+                console.print(f"[green]Channel is ready at: {final_channel_path}")
+            else:
+                raise ValueError(f"Unsupported repository: {repo}")
 
 
 def get_matching_artifact(
     artifacts: PaginatedList[Artifact], artifact_name_pattern: str
 ) -> Artifact | None:
     for artifact in artifacts:
+        if artifact.expired:
+            continue
         if artifact_name_pattern in artifact.name:
             return artifact
     return None
 
 
+def find_run_artifact(run: WorkflowRun, artifact_name_pattern: str) -> Artifact | None:
+    """Find a non-expired artifact on a run matching the pattern."""
+    return get_matching_artifact(run.get_artifacts(), artifact_name_pattern)
+
+
 def load_env_files() -> None:
     """Load both .env and .env.ci files if they exist."""
     project_root = Path(__file__).parent.parent
@@ -217,25 +390,36 @@ def get_token_from_gh() -> str | None:
     return token
 
 
+# Serializes the read-modify-write of download-metadata.json when several
+# targets are downloaded concurrently.
+_METADATA_LOCK = threading.Lock()
+
+
 def write_metadata(
     output_dir: Path,
     repo: str,
     metadata: dict[str, object],
 ) -> None:
     metadata_path = output_dir / "download-metadata.json"
-    existing: dict[str, object] = {}
-    if metadata_path.exists():
-        try:
-            existing = json.loads(metadata_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            console.print(
-                f"[yellow]Existing metadata file at {metadata_path} is invalid JSON; overwriting"
-            )
-    existing[repo] = metadata
-    metadata_path.write_text(json.dumps(existing, indent=2, sort_keys=True), encoding="utf-8")
+    with _METADATA_LOCK:
+        existing: dict[str, object] = {}
+        if metadata_path.exists():
+            try:
+                existing = json.loads(metadata_path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                console.print(
+                    f"[yellow]Existing metadata file at {metadata_path} is invalid JSON; overwriting"
+                )
+        existing[repo] = metadata
+        # Write via a sibling temp file and rename so a crash mid-write never
+        # leaves a truncated metadata file behind.
+        tmp_path = metadata_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_dump_metadata(existing))
+        os.replace(tmp_path, metadata_path)
 
 
 def download_github_artifact(
+    gh: Github,
     github_token: str | None,
     output_dir: Path,
     repo: str,
@@ -243,24 +427,13 @@ def download_github_artifact(
     run_id: int | None = None,
     pr_number: int | None = None,
 ) -> None:
-    # Get current platform
-    current_platform = get_current_platform()
-
-    # Initialize GitHub client
-    gh = Github(github_token)
+    # Find the artifact for our platform
+    artifact_name_pattern = artifact_pattern(repo)
 
     # Get the repository
     repository = gh.get_repo(repo)
     console.print(f"[green]Connected to repository: {repository.full_name}")
 
-    # Find the artifact for our platform
-    if repo.endswith("/pixi"):
-        artifact_name_pattern = f"pixi-{current_platform}"
-    elif repo.endswith("/pixi-build-backends"):
-        artifact_name_pattern = f"pixi-build-backends-{current_platform}"
-    else:
-        raise ValueError(f"Unsupported repository: {repo}")
-
     # Get the target_artifact
     target_artifact = None
     pr = None
@@ -270,8 +443,7 @@ def download_github_artifact(
         # Use specific run ID - no need to find workflow first
         console.print(f"[blue]Using specified run ID: {run_id}")
         selected_run = repository.get_workflow_run(run_id)
-        artifacts = selected_run.get_artifacts()
-        target_artifact = get_matching_artifact(artifacts, artifact_name_pattern)
+        target_artifact = find_run_artifact(selected_run, artifact_name_pattern)
     elif pr_number:
         # Get workflow run from PR
         console.print(f"[blue]Finding workflow run for PR #{pr_number}")
@@ -279,48 +451,27 @@ def download_github_artifact(
         console.print(f"[blue]PR #{pr_number}: {pr.title} (head: {pr.head.sha})")
 
         # Get workflow runs for the PR's head commit
-        workflows = repository.get_workflows()
-        target_workflow = None
-        for wf in workflows:
-            if wf.name == workflow:
-                target_workflow = wf
-                break
-
-        if not target_workflow:
-            console.print(f"[red]Could not find workflow: {workflow}")
-            raise ValueError(f"Could not find workflow: {workflow}")
-
+        target_workflow = resolve_workflow(repository, workflow)
         console.print(f"[blue]Found workflow: {target_workflow.name}")
 
-        # Get workflow runs for the PR head commit
-        runs = target_workflow.get_runs(head_sha=pr.head.sha)
+        # Get successful workflow runs for the PR head commit; filtering
+        # server-side avoids probing artifacts of in-progress or failed runs
+        runs = target_workflow.get_runs(head_sha=pr.head.sha, status="success")
         for selected_run in itertools.islice(runs, 3):
-            artifacts = selected_run.get_artifacts()
-            target_artifact = get_matching_artifact(artifacts, artifact_name_pattern)
+            target_artifact = find_run_artifact(selected_run, artifact_name_pattern)
             if target_artifact:
                 break
     else:
         # Get the latest workflow run for the specified workflow
-        workflows = repository.get_workflows()
-        target_workflow = None
-        for wf in workflows:
-            if wf.name == workflow:
-                target_workflow = wf
-                break
-
-        if not target_workflow:
-            console.print(f"[red]Could not find workflow: {workflow}")
-            raise ValueError(f"Could not find workflow: {workflow}")
-
+        target_workflow = resolve_workflow(repository, workflow)
         console.print(f"[blue]Found workflow: {target_workflow.name}")
 
         # Get latest workflow run from main branch
         console.print("[blue]Finding latest workflow run from main branch")
-        runs = target_workflow.get_runs(branch="main", event="push")
+        runs = target_workflow.get_runs(branch="main", event="push", status="success")
         # Check the past five runs until a suitable candidate is found
         for selected_run in itertools.islice(runs, 3):
-            artifacts = selected_run.get_artifacts()
-            target_artifact = get_matching_artifact(artifacts, artifact_name_pattern)
+            target_artifact = find_run_artifact(selected_run, artifact_name_pattern)
             if target_artifact:
                 break
 
@@ -332,9 +483,9 @@ def download_github_artifact(
     if not target_artifact:
         console.print(f"[red]Could not find artifact matching pattern '{artifact_name_pattern}'")
         console.print("[yellow]Available artifacts:")
-        available_artifacts = [artifact.name for artifact in artifacts]
-        for artifact in artifacts:
-            console.print(f"  - {artifact.name}")
+        available_artifacts = [artifact.name for artifact in selected_run.get_artifacts()]
+        for name in available_artifacts:
+            console.print(f"  - {name}")
         raise FileNotFoundError(
             f"Could not find artifact matching pattern '{artifact_name_pattern}'. "
             f"Available artifacts: {available_artifacts}"
@@ -430,25 +581,36 @@ def main() -> None:
         )
         sys.exit(1)
 
-    overall_success = True
-    for target in targets:
+    # One client for all targets: shared connection pool, larger pages so
+    # paginated artifact listings need fewer requests, and built-in retries.
+    gh = Github(github_token, per_page=100, pool_size=16, retry=3)
+
+    def download_target(target: ArtifactTarget) -> None:
         pr_number = target.pr_number
         pr_number_int = int(pr_number) if pr_number and pr_number.isdigit() else None
         if pr_number_int:
             console.print(f"[yellow]Using PR #{pr_number_int} from {target.repo}")
 
-        try:
-            download_github_artifact(
-                github_token,
-                output_dir,
-                target.repo,
-                target.workflow,
-                args.run_id,
-                pr_number_int,
-            )
-        except Exception as e:  # noqa: BLE001 - surface context rich message
-            overall_success = False
-            console.print(f"[red][ERROR] Download failed for {target.repo}: {e}")
+        download_github_artifact(
+            gh,
+            github_token,
+            output_dir,
+            target.repo,
+            target.workflow,
+            args.run_id,
+            pr_number_int,
+        )
+
+    # The targets are independent, so their downloads and extractions overlap.
+    overall_success = True
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = {executor.submit(download_target, target): target for target in targets}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:  # noqa: BLE001 - surface context rich message
+                overall_success = False
+                console.print(f"[red][ERROR] Download failed for {futures[future].repo}: {e}")
 
     if not overall_success:
         sys.exit(1)
@@ -1,11 +1,15 @@
+import hashlib
 import os
 import platform
 import re
+import shlex
 import shutil
 import subprocess
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import cache
 from pathlib import Path
 from typing import Any, Generator
 
@@ -14,6 +18,9 @@ import tomllib
 import yaml
 from rattler import Platform
 
+# Prefer the libyaml dumper when pyyaml was built with it.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 PIXI_VERSION = "0.47.0"
 
 
@@ -44,8 +51,8 @@ def get_local_backend_channel() -> str:
 
 
 def copy_manifest(
-    src: os.PathLike[str],
-    dst: os.PathLike[str],
+    src: str | os.PathLike[str],
+    dst: str | os.PathLike[str],
 ) -> Path:
     """
     Copy file with special handling for pixi manifest.
@@ -95,6 +102,98 @@ def copy_manifest(
     return copied_path
 
 
+# Files with these suffixes are mutated in place by tests after copying; hardlinking
+# them would write through to the shared stage, so they always get a real copy.
+_MUTABLE_SUFFIXES = {".cpp", ".lock", ".md", ".py", ".toml", ".txt", ".yaml", ".yml"}
+
+
+def _stage_cache_root() -> Path:
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home().joinpath(".cache")
+    return base.joinpath("pixi-build-testsuite")
+
+
+def _tree_fingerprint(src: Path, extra: str = "") -> str:
+    """Fingerprint a source tree by relative path, size and mtime of its files."""
+    hasher = hashlib.blake2b(extra.encode(), digest_size=16)
+    for path in sorted(src.rglob("*")):
+        if ".pixi" in path.parts or path.suffix == ".conda":
+            continue
+        if not path.is_file():
+            continue
+        stat = path.stat()
+        hasher.update(
+            f"{path.relative_to(src).as_posix()}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+        )
+    return hasher.hexdigest()
+
+
+def clone_tree(src: Path, dst: Path) -> Path:
+    """
+    Clone a tree with hardlinks where that is safe, skipping `.pixi`
+    directories and `*.conda` artifacts.
+
+    Files that tests rewrite in place (manifests, recipes, sources) get a real
+    copy so the shared source of the links is never modified through a link.
+    """
+    for root, dirs, files in os.walk(src):
+        if ".pixi" in dirs:
+            dirs.remove(".pixi")
+        target_root = dst.joinpath(Path(root).relative_to(src))
+        target_root.mkdir(parents=True, exist_ok=True)
+        for file_name in files:
+            if file_name.endswith(".conda"):
+                continue
+            source = Path(root, file_name)
+            target = target_root.joinpath(file_name)
+            if target.exists():
+                target.unlink()
+            if source.suffix in _MUTABLE_SUFFIXES:
+                shutil.copy2(source, target)
+                continue
+            try:
+                os.link(source, target)
+            except OSError:
+                # Hardlinks can fail across devices; fall back to a plain copy.
+                shutil.copy2(source, target)
+    return dst
+
+
+def _staged_copy(src: Path) -> Path | None:
+    """
+    Return a cached copy of ``src`` with manifests already rewritten to the
+    local backend channel, or ``None`` when staging is not possible.
+
+    The stage is keyed on the source tree fingerprint and the channel URI, so
+    warm re-runs of the suite skip both the full copy and the manifest rewrite.
+    """
+    try:
+        local_uri = get_local_backend_channel()
+    except Exception:
+        return None
+
+    stage_root = _stage_cache_root()
+    stage = stage_root.joinpath(f"stage-{_tree_fingerprint(src, extra=local_uri)}")
+    if stage.is_dir():
+        return stage
+
+    scratch = stage.with_name(f"{stage.name}.tmp-{os.getpid()}")
+    try:
+        stage_root.mkdir(parents=True, exist_ok=True)
+        shutil.copytree(
+            src,
+            scratch,
+            ignore=shutil.ignore_patterns(".pixi", "*.conda"),
+            copy_function=copy_manifest,
+        )
+        os.replace(scratch, stage)
+    except OSError:
+        shutil.rmtree(scratch, ignore_errors=True)
+        # Another process may have won the race to populate the stage.
+        return stage if stage.is_dir() else None
+    return stage
+
+
 def copytree_with_local_backend(
     src: os.PathLike[str],
     dst: os.PathLike[str],
@@ -102,12 +201,34 @@ def copytree_with_local_backend(
 ) -> Path:
     kwargs.setdefault("copy_function", copy_manifest)
 
+    if not _IS_WINDOWS and kwargs["copy_function"] is copy_manifest:
+        stage = _staged_copy(Path(src))
+        if stage is not None:
+            return clone_tree(stage, Path(dst))
+
     # Copy tree while ignoring .pixi directories
     return Path(
         shutil.copytree(src, dst, ignore=shutil.ignore_patterns(".pixi", "*.conda"), **kwargs)
     )
 
 
+def _write_if_changed(path: Path, content: str) -> None:
+    """
+    Write ``content`` to ``path`` unless it is already there.
+
+    Rewriting identical bytes would bump the mtime, which pixi's input
+    hashing treats as a change; skipping the write keeps repeated
+    ``write_files`` calls from invalidating the build cache spuriously.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    path.write_bytes(data)
+
+
 @dataclass
 class Workspace:
     recipe: dict[str, Any]
@@ -119,11 +240,11 @@ class Workspace:
     debug_dir: Path
 
     def write_files(self) -> None:
-        self.recipe_path.write_text(yaml.dump(self.recipe))
+        _write_if_changed(self.recipe_path, yaml.dump(self.recipe, Dumper=_YAML_DUMPER))
         workspace_manifest_path = self.workspace_dir.joinpath("pixi.toml")
-        workspace_manifest_path.write_text(tomli_w.dumps(self.workspace_manifest))
+        _write_if_changed(workspace_manifest_path, tomli_w.dumps(self.workspace_manifest))
         package_manifest_path = self.package_dir.joinpath("pixi.toml")
-        package_manifest_path.write_text(tomli_w.dumps(self.package_manifest))
+        _write_if_changed(package_manifest_path, tomli_w.dumps(self.package_manifest))
 
     def iter_debug_dirs(self) -> list[Path]:
         candidates: list[Path] = []
@@ -166,6 +287,21 @@ class Output:
         return f"command: {self.command}"
 
 
+# Compiled once; verify_cli_command strips colours from megabytes of verbose
+# build output, so recompiling per call adds up.
+_ANSI_ESCAPE_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+
+# Environment defaults merged into every verify_cli_command subprocess; conftest
+# uses this to point all pixi invocations at a session-shared cache.
+_DEFAULT_CLI_ENV: dict[str, str] = {}
+
+
+def set_default_cli_env(env: dict[str, str]) -> None:
+    """Register environment variables that every verify_cli_command call inherits."""
+    _DEFAULT_CLI_ENV.update(env)
+
+
 def verify_cli_command(
     command: list[Path | str],
     expected_exit_code: ExitCode = ExitCode.SUCCESS,
@@ -179,7 +315,9 @@ def verify_cli_command(
     strip_ansi: bool = False,
 ) -> Output:
     base_env = {} if reset_env else dict(os.environ)
-    complete_env = base_env if env is None else base_env | env
+    complete_env = base_env | _DEFAULT_CLI_ENV
+    if env is not None:
+        complete_env |= env
     # Set `PIXI_NO_WRAP` to avoid to have miette wrapping lines
     complete_env |= {"PIXI_NO_WRAP": "1"}
 
@@ -195,9 +333,8 @@ def verify_cli_command(
 
     if strip_ansi:
         # sanitise coloured output to match plain strings
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        stdout = ansi_escape.sub("", stdout)
-        stderr = ansi_escape.sub("", stderr)
+        stdout = _ANSI_ESCAPE_RE.sub("", stdout)
+        stderr = _ANSI_ESCAPE_RE.sub("", stderr)
 
     returncode = process.returncode
     output = Output(command, stdout, stderr, returncode)
@@ -237,18 +374,53 @@ def verify_cli_command(
     return output
 
 
-def bat_extension(exe_name: str) -> str:
+def verify_cli_commands_batched(
+    commands: list[list[Path | str]],
+    expected_exit_code: ExitCode = ExitCode.SUCCESS,
+    stdout_contains: str | list[str] | None = None,
+    stdout_excludes: str | list[str] | None = None,
+    stderr_contains: str | list[str] | None = None,
+    stderr_excludes: str | list[str] | None = None,
+    env: dict[str, str] | None = None,
+    cwd: str | Path | None = None,
+) -> Output:
+    """
+    Run several commands in a single shell invocation, chained with ``&&``.
+
+    This saves one process spawn per command when a test only needs the
+    combined output and a single exit code. Tests that must assert on each
+    command's exit code separately should keep using ``verify_cli_command``.
+    """
     if platform.system() == "Windows":
-        return exe_name + ".bat"
+        joined = " && ".join(subprocess.list2cmdline(map(str, command)) for command in commands)
+        shell_command: list[Path | str] = ["cmd", "/c", joined]
     else:
-        return exe_name
+        joined = " && ".join(shlex.join(map(str, command)) for command in commands)
+        shell_command = ["sh", "-c", joined]
+
+    return verify_cli_command(
+        shell_command,
+        expected_exit_code=expected_exit_code,
+        stdout_contains=stdout_contains,
+        stdout_excludes=stdout_excludes,
+        stderr_contains=stderr_contains,
+        stderr_excludes=stderr_excludes,
+        env=env,
+        cwd=cwd,
+    )
+
+
+# Evaluated once; platform.system() is a syscall-backed lookup and these
+# helpers run for every executable path a test constructs.
+_IS_WINDOWS = platform.system() == "Windows"
+
+
+def bat_extension(exe_name: str) -> str:
+    return exe_name + ".bat" if _IS_WINDOWS else exe_name
 
 
 def exec_extension(exe_name: str) -> str:
-    if platform.system() == "Windows":
-        return exe_name + ".exe"
-    else:
-        return exe_name
+    return exe_name + ".exe" if _IS_WINDOWS else exe_name
 
 
 def is_binary(path: Path) -> bool:
@@ -261,14 +433,60 @@ def pixi_dir(project_root: Path) -> Path:
     return project_root.joinpath(".pixi")
 
 
+def count_matching(directory: Path, suffix: str) -> int:
+    """
+    Count entries in ``directory`` whose name ends with ``suffix``.
+
+    Cheaper than ``Path.glob`` for count-only assertions: a single pass over
+    the dirents without stat-ing or collecting every entry.
+    """
+    with os.scandir(directory) as entries:
+        return sum(1 for entry in entries if entry.name.endswith(suffix))
+
+
+def bump_mtime(path: Path) -> None:
+    """
+    Advance ``path``'s mtime by at least a full second.
+
+    ``Path.touch`` sets the mtime to the current wallclock, which on
+    coarse-timestamp filesystems can coincide with the previous value and
+    leave mtime-based invalidation untriggered. An explicit ``os.utime``
+    guarantees the bump and skips the open/close ``touch`` performs.
+    """
+    stat = os.stat(path)
+    timestamp_ns = max(time.time_ns(), stat.st_mtime_ns + 1_000_000_000)
+    os.utime(path, ns=(timestamp_ns, timestamp_ns))
+
+
+def list_conda_packages(directory: Path) -> list[Path]:
+    """
+    List the ``.conda`` packages in ``directory`` in one scandir pass.
+
+    The dirents already prove the files exist, so callers don't need a
+    follow-up ``exists`` stat per package.
+    """
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries if entry.name.endswith(".conda")]
+
+
 def default_env_path(project_root: Path) -> Path:
     return pixi_dir(project_root).joinpath("envs", "default")
 
 
+@cache
 def repo_root() -> Path:
     return Path(__file__).parents[2]
 
 
+@cache
+def minimal_backend_workspaces() -> tuple[Path, ...]:
+    """List the minimal backend workspace projects once per process."""
+    workspaces_dir = repo_root().joinpath(
+        "tests", "data", "pixi_build", "minimal-backend-workspaces"
+    )
+    return tuple(sorted(path for path in workspaces_dir.iterdir() if path.is_dir()))
+
+
 def current_platform() -> str:
     return str(Platform.current())
 
@@ -295,14 +513,62 @@ def cwd(path: str | Path) -> Generator[None, None, None]:
         os.chdir(oldpwd)
 
 
+def _cached_git_repo(source_dir: Path, repo_name: str) -> Path | None:
+    """
+    Return a memoized git repository for ``source_dir``, or ``None`` when the
+    cache is not usable.
+
+    The repository is keyed on the source tree fingerprint and the local
+    backend channel URI, so every test asking for the same source gets the
+    same repository back instead of paying `git init`/`add`/`commit` again.
+    """
+    try:
+        local_uri = get_local_backend_channel()
+    except Exception:
+        return None
+
+    cache_root = _stage_cache_root()
+    key = _tree_fingerprint(source_dir, extra=f"{repo_name}:{local_uri}")
+    repo_path = cache_root.joinpath(f"git-repo-{key}")
+    if repo_path.joinpath(".git").is_dir():
+        return repo_path
+
+    scratch = repo_path.with_name(f"{repo_path.name}.tmp-{os.getpid()}")
+    try:
+        cache_root.mkdir(parents=True, exist_ok=True)
+        copytree_with_local_backend(source_dir, scratch, copy_function=copy_manifest)
+        _init_git_repo(scratch)
+        os.replace(scratch, repo_path)
+    except (OSError, subprocess.CalledProcessError):
+        shutil.rmtree(scratch, ignore_errors=True)
+        # Another process may have won the race to populate the cache.
+        return repo_path if repo_path.joinpath(".git").is_dir() else None
+    return repo_path
+
+
 def git_test_repo(source_dir: Path, repo_name: str, target_dir: Path) -> str:
-    """Create a git repository from the source directory in a target directory."""
+    """
+    Create a git repository from the source directory in a target directory.
+
+    Repositories are memoized by source fingerprint, so repeated calls for the
+    same source return the same repository URL without rebuilding it.
+    """
+    cached = _cached_git_repo(source_dir, repo_name)
+    if cached is not None:
+        return f"file://{cached}"
+
     repo_path: Path = target_dir / repo_name
 
     # Copy source directory to temp
     copytree_with_local_backend(source_dir, repo_path, copy_function=copy_manifest)
 
-    # Initialize git repository in the copied source
+    _init_git_repo(repo_path)
+
+    return f"file://{repo_path}"
+
+
+def _init_git_repo(repo_path: Path) -> None:
+    """Initialize a git repository at ``repo_path`` and commit its contents."""
     subprocess.run(
         ["git", "init"],
         cwd=repo_path,
@@ -335,5 +601,3 @@ def git_test_repo(source_dir: Path, repo_name: str, target_dir: Path) -> str:
         check=True,
         capture_output=True,
     )
-
-    return f"file://{repo_path}"
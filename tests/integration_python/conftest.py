@@ -1,12 +1,16 @@
+import copy
 import json
 import os
 import shutil
+import subprocess
+from functools import cache
 from pathlib import Path
 from typing import Any, cast
 from urllib.parse import unquote, urlparse
 from urllib.request import url2pathname
 
 import dotenv
+import filelock
 import pytest
 
 from .common import (
@@ -15,6 +19,7 @@ from .common import (
     exec_extension,
     get_local_backend_channel,
     repo_root,
+    set_default_cli_env,
 )
 
 
@@ -60,7 +65,7 @@ def local_backend_channel_uri(local_backend_channel_dir: Path) -> str:
     return local_backend_channel_dir.as_uri()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def build_data(test_data: Path) -> Path:
     """
     Returns the pixi build test data
@@ -68,7 +73,15 @@ def build_data(test_data: Path) -> Path:
     return test_data.joinpath("pixi_build")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def rattler_build_data(build_data: Path) -> Path:
+    """
+    Returns the rattler-build backend test data
+    """
+    return build_data.joinpath("rattler-build-backend")
+
+
+@pytest.fixture(scope="session")
 def examples_dir() -> Path:
     """
     Returns the path to the examples directory in the root of the repository
@@ -76,26 +89,17 @@ def examples_dir() -> Path:
     return Path(__file__).parents[3].joinpath("examples").resolve()
 
 
-@pytest.fixture
-def simple_workspace(
-    tmp_pixi_workspace: Path,
-    request: pytest.FixtureRequest,
+@cache
+def _simple_workspace_manifests(
     local_backend_channel_uri: str,
-) -> Workspace:
-    name = request.node.name
-
-    workspace_dir = tmp_pixi_workspace.joinpath("workspace")
-    workspace_dir.mkdir()
-    shutil.move(tmp_pixi_workspace.joinpath(".pixi"), workspace_dir.joinpath(".pixi"))
-
-    debug_dir = tmp_pixi_workspace.joinpath("debug_dir")
-    debug_dir.mkdir()
-
-    recipe = {"package": {"name": name, "version": "1.0.0"}}
-
-    package_rel_dir = "package"
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Static manifest skeletons shared by every simple_workspace instance.
 
-    workspace_manifest = {
+    The per-test package name is filled in on a deep copy, so the skeletons are
+    built once per session instead of once per test.
+    """
+    workspace_manifest: dict[str, Any] = {
         "workspace": {
             "channels": [
                 local_backend_channel_uri,
@@ -104,12 +108,11 @@ def simple_workspace(
             "preview": ["pixi-build"],
             "platforms": [CURRENT_PLATFORM],
         },
-        "dependencies": {name: {"path": package_rel_dir}},
+        "dependencies": {},
     }
 
-    package_manifest = {
+    package_manifest: dict[str, Any] = {
         "package": {
-            "name": name,
             "version": "1.0.0",
             "build": {
                 "backend": {
@@ -124,6 +127,35 @@ def simple_workspace(
         },
     }
 
+    return workspace_manifest, package_manifest
+
+
+@pytest.fixture
+def simple_workspace(
+    tmp_pixi_workspace: Path,
+    request: pytest.FixtureRequest,
+    local_backend_channel_uri: str,
+) -> Workspace:
+    name = request.node.name
+
+    workspace_dir = tmp_pixi_workspace.joinpath("workspace")
+    workspace_dir.mkdir()
+    shutil.move(tmp_pixi_workspace.joinpath(".pixi"), workspace_dir.joinpath(".pixi"))
+
+    debug_dir = tmp_pixi_workspace.joinpath("debug_dir")
+    debug_dir.mkdir()
+
+    recipe = {"package": {"name": name, "version": "1.0.0"}}
+
+    package_rel_dir = "package"
+
+    workspace_template, package_template = _simple_workspace_manifests(local_backend_channel_uri)
+    workspace_manifest = copy.deepcopy(workspace_template)
+    workspace_manifest["dependencies"] = {name: {"path": package_rel_dir}}
+
+    package_manifest = copy.deepcopy(package_template)
+    package_manifest["package"]["name"] = name
+
     package_dir = workspace_dir.joinpath(package_rel_dir)
     package_dir.mkdir(exist_ok=True)
     recipe_path = package_dir.joinpath("recipe.yaml")
@@ -139,17 +171,19 @@ def simple_workspace(
     )
 
 
+@cache
 def _metadata_path() -> Path:
     return repo_root().joinpath("artifacts", "download-metadata.json")
 
 
+@cache
 def _load_artifact_metadata() -> dict[str, object]:
     metadata_file = _metadata_path()
     if not metadata_file.exists():
         return {}
 
     try:
-        data: Any = json.loads(metadata_file.read_text(encoding="utf-8"))
+        data: Any = json.loads(metadata_file.read_bytes())
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
         raise RuntimeError(
             f"Artifact metadata file at {metadata_file} is not valid JSON. Re-run 'pixi run download-artifacts'."
@@ -223,14 +257,42 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
-@pytest.fixture
-def pixi() -> Path:
+_DURATIONS_CACHE_KEY = "pixi-build-testsuite/durations"
+
+# Durations recorded during this run, persisted at session finish so the next
+# run can dispatch the slowest tests first.
+_recorded_durations: dict[str, float] = {}
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    if report.when == "call":
+        _recorded_durations[report.nodeid] = report.duration
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if not _recorded_durations:
+        return
+    durations: dict[str, float] = session.config.cache.get(_DURATIONS_CACHE_KEY, {})
+    durations.update(_recorded_durations)
+    session.config.cache.set(_DURATIONS_CACHE_KEY, durations)
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
     """
-    Returns the path to the Pixi executable.
+    Order tests by recorded duration, slowest first.
 
-    Uses the PIXI_BIN_DIR environment variable to locate the Pixi directory.
-    Falls back to binaries downloaded into the artifacts directory.
+    Under xdist this dispatches the long-running build tests before the quick
+    ones, so workers do not sit idle waiting on a single straggler at the end
+    of the run. Without recorded durations the collection order is kept as-is.
     """
+    durations: dict[str, float] = config.cache.get(_DURATIONS_CACHE_KEY, {})
+    if not durations:
+        return
+    items.sort(key=lambda item: durations.get(item.nodeid, 0.0), reverse=True)
+
+
+@cache
+def _resolve_pixi_executable() -> Path:
     pixi_bin_dir = os.getenv("PIXI_BIN_DIR")
 
     if pixi_bin_dir:
@@ -275,6 +337,119 @@ def pixi() -> Path:
     return pixi_executable
 
 
+@pytest.fixture(scope="session")
+def pixi() -> Path:
+    """
+    Returns the path to the Pixi executable.
+
+    Uses the PIXI_BIN_DIR environment variable to locate the Pixi directory.
+    Falls back to binaries downloaded into the artifacts directory.
+    """
+    return _resolve_pixi_executable()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_pixi_caches(tmp_path_factory: pytest.TempPathFactory) -> dict[str, str] | None:
+    """
+    Point every pixi invocation at a session-shared cache directory.
+
+    Opt-in via PIXI_TESTSUITE_SHARED_CACHE=1 so CI keeps fully isolated runs.
+    Locally this lets repodata, package tarballs and solver caches survive
+    across tests instead of being refetched for every fresh workspace.
+    """
+    if os.environ.get("PIXI_TESTSUITE_SHARED_CACHE") != "1":
+        return None
+
+    base = tmp_path_factory.getbasetemp()
+    if base.name.startswith("popen-gw"):
+        # Running in an xdist worker; share the base dir across workers.
+        base = base.parent
+    # One cache per worker: rattler serializes cache access with file locks,
+    # so a single shared directory would contend across workers.
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    cache_dir = base.joinpath(f"pixi-cache-{worker_id}")
+    cache_dir.mkdir(exist_ok=True)
+    env = {
+        "PIXI_CACHE_DIR": str(cache_dir),
+        "RATTLER_CACHE_DIR": str(cache_dir),
+    }
+    set_default_cli_env(env)
+    return env
+
+
+# Backends most tests end up resolving; warming them once amortizes the fetch.
+_WARMUP_BACKENDS = (
+    "pixi-build-cmake",
+    "pixi-build-python",
+    "pixi-build-rattler-build",
+    "pixi-build-rust",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_pixi_cache(
+    shared_pixi_caches: dict[str, str] | None,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    """
+    Prime the rattler repodata and backend caches once per session.
+
+    The first pixi invocation of a cold run pays the sharded repodata fetch for
+    conda-forge plus the download of the build backends; doing it up front
+    behind a file lock means parallel xdist workers wait on a single warm-up
+    instead of each paying it themselves.
+    """
+    try:
+        pixi_executable = _resolve_pixi_executable()
+    except (ValueError, FileNotFoundError):
+        # No pixi binary available; tests that need it will report this.
+        return
+
+    channels = ["https://prefix.dev/conda-forge"]
+    dependencies = ['python = "*"']
+    try:
+        backend_channel = get_local_backend_channel()
+    except Exception:
+        backend_channel = None
+    if backend_channel is not None:
+        channels.insert(0, backend_channel)
+        dependencies.extend(f'{backend} = "*"' for backend in _WARMUP_BACKENDS)
+
+    base = tmp_path_factory.getbasetemp()
+    if base.name.startswith("popen-gw"):
+        # Running in an xdist worker; coordinate via the shared parent dir.
+        base = base.parent
+    marker = base.joinpath("repodata-warmup.done")
+    with filelock.FileLock(str(base.joinpath("repodata-warmup.lock"))):
+        if marker.exists():
+            return
+        workspace = tmp_path_factory.mktemp("warmup")
+        channel_list = ", ".join(f'"{channel}"' for channel in channels)
+        dependency_list = "\n".join(dependencies)
+        workspace.joinpath("pixi.toml").write_text(
+            f"""
+[workspace]
+name = "warmup"
+channels = [{channel_list}]
+platforms = ["{CURRENT_PLATFORM}"]
+
+[dependencies]
+{dependency_list}
+"""
+        )
+        env = dict(os.environ)
+        if shared_pixi_caches:
+            env |= shared_pixi_caches
+        # Best effort: a failed warm-up only means the first test pays the fetch.
+        subprocess.run(
+            [str(pixi_executable), "lock", "--manifest-path", str(workspace)],
+            capture_output=True,
+            check=False,
+            env=env,
+        )
+        marker.touch()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def build_backends(
     load_dotenv: None,
@@ -302,12 +477,8 @@ def build_backends(
     os.environ.pop("PIXI_BUILD_BACKEND_OVERRIDE", None)
 
 
-@pytest.fixture
-def tmp_pixi_workspace(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    # Create a short temporary directory name to avoid long path issues on windows.
-    tmp_path = tmp_path_factory.mktemp("px")
-
-    pixi_config = """
+# Written into every test workspace; encoded once instead of per test.
+_PIXI_CONFIG = b"""
 # Reset to defaults
 default-channels = ["conda-forge"]
 shell.change-ps1 = true
@@ -325,32 +496,39 @@ use-environment-activation-cache = false
 [repodata-config."https://prefix.dev/"]
 disable-sharded = false
 """
+
+
+@pytest.fixture
+def tmp_pixi_workspace(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Create a short temporary directory name to avoid long path issues on windows.
+    tmp_path = tmp_path_factory.mktemp("px")
+
     dot_pixi = tmp_path.joinpath(".pixi")
     dot_pixi.mkdir()
-    dot_pixi.joinpath("config.toml").write_text(pixi_config)
+    dot_pixi.joinpath("config.toml").write_bytes(_PIXI_CONFIG)
     return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data() -> Path:
     return Path(__file__).parents[1].joinpath("data").resolve()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def channels(test_data: Path) -> Path:
     return test_data.joinpath("channels", "channels")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dummy_channel_1(channels: Path) -> str:
     return channels.joinpath("dummy_channel_1").as_uri()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_versions_channel_1(channels: Path) -> str:
     return channels.joinpath("multiple_versions_channel_1").as_uri()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def target_specific_channel_1(channels: Path) -> str:
     return channels.joinpath("target_specific_channel_1").as_uri()
@@ -2,7 +2,12 @@ from pathlib import Path
 
 import pytest
 
-from .common import copytree_with_local_backend, get_manifest, repo_root, verify_cli_command
+from .common import (
+    copytree_with_local_backend,
+    get_manifest,
+    minimal_backend_workspaces,
+    verify_cli_command,
+)
 
 
 @pytest.mark.slow
@@ -10,10 +15,7 @@ from .common import copytree_with_local_backend, get_manifest, repo_root, verify
     "pixi_project",
     [
         pytest.param(example_path, id=example_path.name)
-        for example_path in repo_root()
-        .joinpath("tests", "data", "pixi_build", "minimal-backend-workspaces")
-        .iterdir()
-        if example_path.is_dir()
+        for example_path in minimal_backend_workspaces()
     ],
 )
 def test_pixi_minimal_backend(pixi_project: Path, pixi: Path, tmp_pixi_workspace: Path) -> None:
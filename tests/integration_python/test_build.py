@@ -8,8 +8,11 @@ from .common import (
     CURRENT_PLATFORM,
     ExitCode,
     Workspace,
+    bump_mtime,
     copy_manifest,
     copytree_with_local_backend,
+    count_matching,
+    list_conda_packages,
     verify_cli_command,
 )
 
@@ -38,10 +41,85 @@ def test_build_conda_package(
     assert not simple_workspace.workspace_dir.joinpath(CURRENT_PLATFORM).exists()
 
     # Ensure that exactly one conda package has been built
-    built_packages = list(simple_workspace.workspace_dir.glob("*.conda"))
-    assert len(built_packages) == 1
+    assert count_matching(simple_workspace.workspace_dir, ".conda") == 1
 
 
+def test_cache_invalidation_sequence(pixi: Path, simple_workspace: Workspace) -> None:
+    """
+    Verify the cache-invalidation properties of one workspace in sequence.
+
+    This covers the same behaviour as the three `comprehensive`-marked tests
+    below while building the workspace only once: an unchanged reinstall is
+    fully cached, touching the recipe re-runs the build, and changing the
+    project model triggers a rebuild.
+    """
+    simple_workspace.write_files()
+    verify_cli_command(
+        [
+            pixi,
+            "install",
+            "-v",
+            "--manifest-path",
+            simple_workspace.workspace_dir,
+        ],
+        stderr_contains=BUILD_RUNNING_STRING,
+    )
+
+    conda_build_params = simple_workspace.find_debug_file("conda_build_v1_params.json")
+    assert conda_build_params is not None
+
+    # Remove the files to get a clean state
+    conda_build_params.unlink()
+
+    # Reinstalling without any change should be fully cached: no build call
+    verify_cli_command(
+        [
+            pixi,
+            "install",
+            "-v",
+            "--manifest-path",
+            simple_workspace.workspace_dir,
+        ],
+        stderr_excludes=BUILD_RUNNING_STRING,
+    )
+    assert simple_workspace.find_debug_file("conda_build_v1_params.json") is None
+
+    # Touching the recipe should invalidate the metadata and re-run the build
+    bump_mtime(simple_workspace.recipe_path)
+    verify_cli_command(
+        [
+            pixi,
+            "install",
+            "-v",
+            "--manifest-path",
+            simple_workspace.workspace_dir,
+        ],
+        stderr_contains=BUILD_RUNNING_STRING,
+    )
+
+    conda_build_params = simple_workspace.find_debug_file("conda_build_v1_params.json")
+    assert conda_build_params is not None
+    conda_build_params.unlink()
+
+    # Modifying the project model should trigger a rebuild as well
+    simple_workspace.package_manifest["package"]["build"].setdefault(
+        "configuration", dict()
+    ).setdefault("extra-input-globs", ["*.md"])
+    simple_workspace.write_files()
+    verify_cli_command(
+        [
+            pixi,
+            "install",
+            "-v",
+            "--manifest-path",
+            simple_workspace.workspace_dir,
+        ],
+        stderr_contains=BUILD_RUNNING_STRING,
+    )
+    assert simple_workspace.find_debug_file("conda_build_v1_params.json") is not None
+
+
+@pytest.mark.comprehensive
 def test_no_change_should_be_fully_cached(pixi: Path, simple_workspace: Workspace) -> None:
     simple_workspace.write_files()
     verify_cli_command(
@@ -77,6 +155,7 @@ def test_no_change_should_be_fully_cached(pixi: Path, simple_workspace: Workspac
     assert simple_workspace.find_debug_file("conda_build_v1_params.json") is None
 
 
+@pytest.mark.comprehensive
 def test_recipe_change_trigger_metadata_invalidation(
     pixi: Path, simple_workspace: Workspace
 ) -> None:
@@ -94,7 +173,7 @@ def test_recipe_change_trigger_metadata_invalidation(
     )
 
     # Touch the recipe
-    simple_workspace.recipe_path.touch()
+    bump_mtime(simple_workspace.recipe_path)
 
     verify_cli_command(
         [
@@ -108,6 +187,7 @@ def test_recipe_change_trigger_metadata_invalidation(
     )
 
 
+@pytest.mark.comprehensive
 def test_project_model_change_trigger_rebuild(
     pixi: Path, simple_workspace: Workspace, dummy_channel_1: Path
 ) -> None:
@@ -150,47 +230,29 @@ def test_project_model_change_trigger_rebuild(
 
 
 @pytest.mark.slow
-def test_editable_pyproject(pixi: Path, build_data: Path, tmp_pixi_workspace: Path) -> None:
-    """
-    This one tries to run the Python based rich example project,
-    installed as a normal package by overriding with an environment variable.
-    """
-    project = "editable-pyproject"
-    test_data = build_data.joinpath(project)
-
-    target_dir = tmp_pixi_workspace.joinpath(project)
-    copytree_with_local_backend(test_data, target_dir)
-    manifest_path = target_dir.joinpath("pyproject.toml")
-
-    verify_cli_command(
-        [
-            pixi,
-            "install",
-            "-v",
-            "--manifest-path",
-            manifest_path,
-        ],
-    )
-
-    # Verify that package is installed as editable
-    verify_cli_command(
-        [
-            pixi,
-            "run",
-            "-v",
-            "--manifest-path",
-            manifest_path,
-            "check-editable",
-        ],
-        stdout_contains="The package is installed as editable.",
-    )
-
-
-@pytest.mark.slow
-def test_non_editable_pyproject(pixi: Path, build_data: Path, tmp_pixi_workspace: Path) -> None:
+@pytest.mark.parametrize(
+    ("editable", "check_exit_code", "check_message"),
+    [
+        pytest.param(
+            True, ExitCode.SUCCESS, "The package is installed as editable.", id="editable"
+        ),
+        pytest.param(
+            False, ExitCode.FAILURE, "The package is not installed as editable.", id="non-editable"
+        ),
+    ],
+)
+def test_editable_pyproject(
+    editable: bool,
+    check_exit_code: ExitCode,
+    check_message: str,
+    pixi: Path,
+    build_data: Path,
+    tmp_pixi_workspace: Path,
+) -> None:
     """
-    This one tries to run the Python based rich example project,
-    installed as a normal package by overriding with an environment variable.
+    This one tries to run the Python based rich example project, installed
+    either as editable (the backend default) or as a normal package by
+    overriding with an environment variable.
     """
     project = "editable-pyproject"
     test_data = build_data.joinpath(project)
@@ -199,9 +261,7 @@ def test_non_editable_pyproject(pixi: Path, build_data: Path, tmp_pixi_workspace
     copytree_with_local_backend(test_data, target_dir)
     manifest_path = target_dir.joinpath("pyproject.toml")
 
-    env = {
-        "BUILD_EDITABLE_PYTHON": "false",
-    }
+    env = None if editable else {"BUILD_EDITABLE_PYTHON": "false"}
 
     verify_cli_command(
         [
@@ -214,7 +274,7 @@ def test_non_editable_pyproject(pixi: Path, build_data: Path, tmp_pixi_workspace
         env=env,
     )
 
-    # Verify that package is installed as editable
+    # Verify whether the package is installed as editable
     verify_cli_command(
         [
             pixi,
@@ -224,9 +284,9 @@ def test_non_editable_pyproject(pixi: Path, build_data: Path, tmp_pixi_workspace
             manifest_path,
             "check-editable",
         ],
-        ExitCode.FAILURE,
+        check_exit_code,
         env=env,
-        stdout_contains="The package is not installed as editable.",
+        stdout_contains=check_message,
     )
 
 
@@ -234,29 +294,29 @@ def test_non_editable_pyproject(pixi: Path, build_data: Path, tmp_pixi_workspace
 def test_build_using_rattler_build_backend(
     pixi: Path,
     tmp_pixi_workspace: Path,
-    build_data: Path,
+    rattler_build_data: Path,
 ) -> None:
-    test_data = build_data.joinpath("rattler-build-backend")
+    test_data = rattler_build_data
     copytree_with_local_backend(
         test_data / "array-api-extra", tmp_pixi_workspace, dirs_exist_ok=True
     )
 
     manifest_path = tmp_pixi_workspace / "pixi.toml"
 
-    # Running pixi build should build the recipe.yaml
+    # Running pixi build should build the recipe.yaml. No assertions look at
+    # the build log here, so skip the verbose flag and its output volume.
     verify_cli_command(
-        [pixi, "build", "-v", "--manifest-path", manifest_path, "--output-dir", tmp_pixi_workspace],
+        [pixi, "build", "--manifest-path", manifest_path, "--output-dir", tmp_pixi_workspace],
     )
 
     # really make sure that conda package was built
-    package_to_be_built = next(manifest_path.parent.glob("*.conda"))
+    (package_to_be_built,) = list_conda_packages(manifest_path.parent)
 
     assert "array-api-extra" in package_to_be_built.name
-    assert package_to_be_built.exists()
 
     # check that immediately repeating the build also works (prefix-dev/pixi-build-backends#287)
     verify_cli_command(
-        [pixi, "build", "-v", "--manifest-path", manifest_path, "--output-dir", tmp_pixi_workspace],
+        [pixi, "build", "--manifest-path", manifest_path, "--output-dir", tmp_pixi_workspace],
     )
 
 
@@ -289,8 +349,10 @@ def test_incremental_builds(
     )
 
 
-def test_error_manifest_deps(pixi: Path, build_data: Path, tmp_pixi_workspace: Path) -> None:
-    test_data = build_data.joinpath("rattler-build-backend")
+def test_error_manifest_deps(
+    pixi: Path, rattler_build_data: Path, tmp_pixi_workspace: Path
+) -> None:
+    test_data = rattler_build_data
     # copy the whole smokey project to the tmp_pixi_workspace
     copytree_with_local_backend(test_data / "smokey", tmp_pixi_workspace / "smokey")
     manifest_path = tmp_pixi_workspace / "smokey" / "pixi.toml"
@@ -309,9 +371,9 @@ def test_error_manifest_deps(pixi: Path, build_data: Path, tmp_pixi_workspace: P
 
 
 def test_error_manifest_deps_no_default(
-    pixi: Path, build_data: Path, tmp_pixi_workspace: Path
+    pixi: Path, rattler_build_data: Path, tmp_pixi_workspace: Path
 ) -> None:
-    test_data = build_data.joinpath("rattler-build-backend")
+    test_data = rattler_build_data
     # copy the whole smokey2 project to the tmp_pixi_workspace
     copytree_with_local_backend(test_data / "smokey2", tmp_pixi_workspace / "smokey2")
     manifest_path = tmp_pixi_workspace / "smokey2" / "pixi.toml"
@@ -330,9 +392,9 @@ def test_error_manifest_deps_no_default(
 
 
 def test_rattler_build_source_dependency(
-    pixi: Path, build_data: Path, tmp_pixi_workspace: Path
+    pixi: Path, rattler_build_data: Path, tmp_pixi_workspace: Path
 ) -> None:
-    test_data = build_data.joinpath("rattler-build-backend")
+    test_data = rattler_build_data
     # copy the whole smokey2 project to the tmp_pixi_workspace
     copytree_with_local_backend(
         test_data / "source-dependency", tmp_pixi_workspace / "source-dependency"
@@ -477,8 +539,7 @@ def test_source_path(pixi: Path, build_data: Path, tmp_pixi_workspace: Path) ->
     )
 
     # Ensure that exactly one conda package has been built
-    built_packages = list(tmp_pixi_workspace.glob("*.conda"))
-    assert len(built_packages) == 1
+    assert count_matching(tmp_pixi_workspace, ".conda") == 1
 
 
 @pytest.mark.slow
@@ -1,8 +1,22 @@
+import os
 from pathlib import Path
 
 import pytest
 
-from .common import copytree_with_local_backend, get_manifest, repo_root, verify_cli_command
+from .common import (
+    PIXI_VERSION,
+    _tree_fingerprint,
+    copytree_with_local_backend,
+    get_manifest,
+    repo_root,
+    verify_cli_command,
+)
+
+
+def _example_fingerprint(example: Path, pixi: Path) -> str:
+    """Fingerprint an example project together with the pixi binary under test."""
+    stat = pixi.stat()
+    return _tree_fingerprint(example, extra=f"{PIXI_VERSION}:{stat.st_mtime_ns}:{stat.st_size}")
 
 
 @pytest.mark.slow
@@ -14,13 +28,27 @@ from .common import copytree_with_local_backend, get_manifest, repo_root, verify
         if example_path.is_dir()
     ],
 )
-def test_pixi_install_examples(pixi_project: Path, pixi: Path, tmp_pixi_workspace: Path) -> None:
+def test_pixi_install_examples(
+    pixi_project: Path,
+    pixi: Path,
+    tmp_pixi_workspace: Path,
+    request: pytest.FixtureRequest,
+) -> None:
     """
     Test that pixi install succeeds for all example projects in the examples directory.
 
     This test iterates through all folders in the examples directory and verifies
     that `pixi install` completes successfully for each project.
+
+    With `PIXI_TESTS_INCREMENTAL=1` examples that are unchanged since their last
+    successful install (same source tree and same pixi binary) are skipped.
     """
+    incremental = os.environ.get("PIXI_TESTS_INCREMENTAL") == "1"
+    cache_key = f"pixi-build-testsuite/examples/{pixi_project.name}"
+    fingerprint = _example_fingerprint(pixi_project, pixi) if incremental else None
+    if incremental and request.config.cache.get(cache_key, None) == fingerprint:
+        pytest.skip("example unchanged since last successful install")
+
     # Copy to workspace
     copytree_with_local_backend(pixi_project, tmp_pixi_workspace, dirs_exist_ok=True)
 
@@ -29,3 +57,6 @@ def test_pixi_install_examples(pixi_project: Path, pixi: Path, tmp_pixi_workspac
 
     # Install the environment
     verify_cli_command([pixi, "install", "-v", "--locked", "--manifest-path", manifest])
+
+    if incremental:
+        request.config.cache.set(cache_key, fingerprint)
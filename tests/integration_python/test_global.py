@@ -11,8 +11,13 @@ from .common import (
     exec_extension,
     git_test_repo,
     verify_cli_command,
+    verify_cli_commands_batched,
 )
 
+# All tests in this module exercise PIXI_HOME semantics and reuse the memoized
+# git test repos, so keep them on one xdist worker.
+pytestmark = pytest.mark.xdist_group("pixi-global")
+
 
 @pytest.mark.parametrize(
     "package_name",
@@ -39,8 +44,13 @@ def test_install_path_dependency(
     if package_name:
         cmd.append(package_name)
 
-    # Test install
-    verify_cli_command(cmd, env=env)
+    # Test install and run the installed binary in the same shell invocation
+    simple_package = pixi_home / "bin" / exec_extension("simple-package")
+    verify_cli_commands_batched(
+        [cmd, [simple_package]],
+        env=env,
+        stdout_contains="hello from simple-package",
+    )
 
     # Ensure that path is relative to the manifest directory
     manifest_path = pixi_home.joinpath("manifests", "pixi-global.toml")
@@ -51,10 +61,6 @@ def test_install_path_dependency(
     assert not source_from_manifest.is_absolute()
     assert manifest_path.parent.joinpath(source_from_manifest).resolve() == source_project.resolve()
 
-    # Check that the package was installed
-    simple_package = pixi_home / "bin" / exec_extension("simple-package")
-    verify_cli_command([simple_package], env=env, stdout_contains="hello from simple-package")
-
 
 @pytest.mark.parametrize(
     "relative",
@@ -1,26 +1,29 @@
 from pathlib import Path
 
-from .common import ExitCode, copytree_with_local_backend, verify_cli_command
-
-
-def test_log_working_quiet(pixi: Path, build_data: Path, tmp_pixi_workspace: Path) -> None:
-    test_data = build_data.joinpath("log-example", "working")
-
-    copytree_with_local_backend(test_data, tmp_pixi_workspace, dirs_exist_ok=True)
-
-    verify_cli_command(
-        [
-            pixi,
-            "install",
-            "--quiet",
-            "--manifest-path",
-            tmp_pixi_workspace,
-        ],
-        stderr_excludes="Building package simple-app",
-    )
+import pytest
 
+from .common import ExitCode, copytree_with_local_backend, verify_cli_command
 
-def test_log_working_default(pixi: Path, build_data: Path, tmp_pixi_workspace: Path) -> None:
+# Keep the log-example tests on one xdist worker so they share the staged
+# copy of the workspace and the packages it pulls in.
+pytestmark = pytest.mark.xdist_group("log-example")
+
+
+@pytest.mark.parametrize(
+    ("quiet", "stderr_contains", "stderr_excludes"),
+    [
+        pytest.param(True, None, "Building package simple-app", id="quiet"),
+        pytest.param(False, "Building package simple-app", None, id="default"),
+    ],
+)
+def test_log_working(
+    quiet: bool,
+    stderr_contains: str | None,
+    stderr_excludes: str | None,
+    pixi: Path,
+    build_data: Path,
+    tmp_pixi_workspace: Path,
+) -> None:
     test_data = build_data.joinpath("log-example", "working")
 
     copytree_with_local_backend(test_data, tmp_pixi_workspace, dirs_exist_ok=True)
@@ -29,10 +32,12 @@ def test_log_working_default(pixi: Path, build_data: Path, tmp_pixi_workspace: P
         [
             pixi,
             "install",
+            *(["--quiet"] if quiet else []),
             "--manifest-path",
             tmp_pixi_workspace,
         ],
-        stderr_contains="Building package simple-app",
+        stderr_contains=stderr_contains,
+        stderr_excludes=stderr_excludes,
     )
 
 
@@ -1,6 +1,12 @@
 from pathlib import Path
 
-from .common import CURRENT_PLATFORM, ExitCode, copytree_with_local_backend, verify_cli_command
+from .common import (
+    CURRENT_PLATFORM,
+    ExitCode,
+    copytree_with_local_backend,
+    count_matching,
+    verify_cli_command,
+)
 
 
 def test_build(pixi: Path, build_data: Path, tmp_pixi_workspace: Path) -> None:
@@ -26,8 +32,7 @@ def test_build(pixi: Path, build_data: Path, tmp_pixi_workspace: Path) -> None:
     assert not tmp_pixi_workspace.joinpath(CURRENT_PLATFORM).exists()
 
     # Ensure that exactly three conda packages have been built
-    built_packages = list(tmp_pixi_workspace.glob("*.conda"))
-    assert len(built_packages) == 3
+    assert count_matching(tmp_pixi_workspace, ".conda") == 3
 
 
 def test_install(pixi: Path, build_data: Path, tmp_pixi_workspace: Path) -> None:
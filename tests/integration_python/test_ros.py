@@ -1,11 +1,11 @@
 import json
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import pytest
 
-from .common import copytree_with_local_backend, verify_cli_command
-
+from .common import copytree_with_local_backend, list_conda_packages, verify_cli_command
 
 ROS_WORKSPACE_NAME = "ros-workspace"
 ROS_PACKAGE_DIRS = ["navigator", "navigator_py", "distro_less_package"]
@@ -23,22 +23,69 @@ def _prepare_ros_workspace(build_data: Path, tmp_pixi_workspace: Path) -> Path:
     return tmp_pixi_workspace
 
 
+# Parsed metadata files keyed by path; re-parsing is skipped while the mtime
+# is unchanged, so repeated lookups in one test cost only stat calls.
+_METADATA_CACHE: dict[Path, tuple[float, dict[str, Any], set[Any]]] = {}
+
+
+def _read_metadata(
+    metadata_file: Path, mtime: float, package_name: str
+) -> tuple[dict[str, Any] | None, set[Any]]:
+    cached = _METADATA_CACHE.get(metadata_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    raw = metadata_file.read_bytes()
+    # A C-level byte scan is orders of magnitude cheaper than building the
+    # dict tree; if the name never appears, this file cannot match. Such
+    # files are not cached since a different package may still need them.
+    if package_name.encode() not in raw:
+        return None, set()
+    metadata = json.loads(raw)
+    output_names = {
+        output.get("metadata", {}).get("name")
+        for output in metadata.get("outputs", [])
+        if isinstance(output, dict)
+    }
+    _METADATA_CACHE[metadata_file] = (mtime, metadata, output_names)
+    return metadata, output_names
+
+
+def _iter_metadata_files(root: Path) -> Iterator[tuple[Path, float]]:
+    """
+    Yield ``(path, mtime)`` for every metadata.json below ``root``.
+
+    Prefers ``os.fwalk`` where available so each stat goes through the open
+    directory fd instead of resolving the full path again; falls back to an
+    iterative scandir walk (which still caches stat results) elsewhere.
+    """
+    if hasattr(os, "fwalk"):
+        for dirpath, _dirnames, filenames, dir_fd in os.fwalk(root):
+            if "metadata.json" in filenames:
+                stat = os.stat("metadata.json", dir_fd=dir_fd)
+                yield Path(dirpath, "metadata.json"), stat.st_mtime
+    else:
+        stack = [str(root)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "metadata.json":
+                        yield Path(entry.path), entry.stat().st_mtime
+
+
 def _load_package_metadata(project_root: Path, package_name: str) -> dict[str, Any]:
     metadata_root = project_root.joinpath(".pixi", "build", "metadata-v0")
     assert metadata_root.exists(), f"metadata directory missing for {package_name}"
     selected_metadata: dict[str, Any] | None = None
     selected_mtime: float = -1.0
-    for metadata_file in metadata_root.rglob("metadata.json"):
-        metadata = json.loads(metadata_file.read_text())
-        outputs = metadata.get("outputs", [])
-        if any(
-            isinstance(output, dict) and output.get("metadata", {}).get("name") == package_name
-            for output in outputs
-        ):
-            mtime = metadata_file.stat().st_mtime
-            if mtime > selected_mtime:
-                selected_metadata = metadata
-                selected_mtime = mtime
+    for metadata_file, mtime in _iter_metadata_files(metadata_root):
+        metadata, output_names = _read_metadata(metadata_file, mtime, package_name)
+        if metadata is None:
+            continue
+        if package_name in output_names and mtime > selected_mtime:
+            selected_metadata = metadata
+            selected_mtime = mtime
     if selected_metadata is not None:
         return selected_metadata
     raise AssertionError(f"metadata for {package_name} not found")
@@ -67,7 +114,7 @@ def test_ros_packages_build(
     )
 
     expected_name = ROS_PACKAGE_OUTPUT_NAMES[package_dir]
-    built_packages = list(output_dir.glob("*.conda"))
+    built_packages = list_conda_packages(output_dir)
     assert built_packages, f"no package artifacts produced for {expected_name}"
     assert any(expected_name in artifact.name for artifact in built_packages)
 
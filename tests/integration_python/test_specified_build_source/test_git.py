@@ -1,5 +1,6 @@
-import json
+import os
 import shutil
+import subprocess
 from pathlib import Path
 from typing import Any, Iterator
 
@@ -10,6 +11,8 @@ import yaml
 
 from ..common import (
     ExitCode,
+    clone_tree,
+    count_matching,
     verify_cli_command,
 )
 from .conftest import LocalGitRepo
@@ -38,8 +41,62 @@ def _git_source_entries(lock_file: Path) -> list[dict[str, Any]]:
     return serialized_sources
 
 
-def extract_git_sources(lock_file: Path) -> list[str]:
-    return sorted(json.dumps(source, sort_keys=True) for source in _git_source_entries(lock_file))
+def _freeze(obj: Any) -> Any:
+    """Canonicalize a JSON-like value into hashable, comparable tuples."""
+    if isinstance(obj, dict):
+        return tuple(sorted((key, _freeze(value)) for key, value in obj.items()))
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+def extract_git_sources(lock_file: Path) -> list[Any]:
+    return sorted(_freeze(source) for source in _git_source_entries(lock_file))
+
+
+def _files_containing_phrase(work_dir: Path, phrase: bytes) -> list[Path]:
+    """
+    Return the files below ``work_dir`` that contain ``phrase``.
+
+    Prefers ripgrep when it is on PATH, which searches the build tree far
+    faster than reading every candidate file into Python. Falls back to a
+    plain Python scan otherwise.
+    """
+    rg = shutil.which("rg")
+    if rg is not None:
+        result = subprocess.run(
+            [
+                rg,
+                "--files-with-matches",
+                "--fixed-strings",
+                "--text",
+                "--no-ignore",
+                "--null",
+                phrase.decode(),
+                str(work_dir),
+            ],
+            capture_output=True,
+        )
+        # ripgrep exits 0 on matches and 1 when nothing matched.
+        if result.returncode in (0, 1):
+            return [Path(os.fsdecode(entry)) for entry in result.stdout.split(b"\0") if entry]
+
+    def iter_candidate_files() -> Iterator[Path]:
+        for path in work_dir.rglob("*"):
+            if not path.is_file():
+                continue
+            if path.suffix in {".o", ".bin", ".txt", ".json"} or "simple-app" in path.name:
+                yield path
+
+    found = []
+    for candidate in iter_candidate_files():
+        try:
+            data = candidate.read_bytes()
+        except OSError:
+            continue
+        if phrase in data:
+            found.append(candidate)
+    return found
 
 
 def configure_local_git_source(
@@ -75,11 +132,8 @@ def prepare_cpp_git_workspace(
 ) -> None:
     project = build_data.joinpath("minimal-backend-workspaces", "pixi-build-cmake")
 
-    # Remove existing .pixi folders
-    shutil.rmtree(project.joinpath(".pixi"), ignore_errors=True)
-
-    # Copy to workspace
-    shutil.copytree(project, workspace_dir, dirs_exist_ok=True)
+    # Copy to workspace; clone_tree skips any stale .pixi folder in the source
+    clone_tree(project, workspace_dir)
 
     kwargs = dict(source_kwargs)
     kwargs.setdefault("subdirectory", ".")
@@ -116,8 +170,7 @@ def test_git_path_build(
         ],
     )
 
-    built_packages = list(tmp_pixi_workspace.glob("*.conda"))
-    assert len(built_packages) == 1
+    assert count_matching(tmp_pixi_workspace, ".conda") == 1
 
 
 @pytest.mark.slow
@@ -247,7 +300,10 @@ def test_git_path_build_has_absolutely_no_respect_to_lock_file(
     )
 
     initial_sources = extract_git_sources(lock_path)
-    assert any(local_cpp_git_repo.other_feature_rev in entry for entry in initial_sources)
+    assert any(
+        entry.get("rev") == local_cpp_git_repo.other_feature_rev
+        for entry in _git_source_entries(lock_path)
+    )
 
     repo_path = local_cpp_git_repo.path
     main_path = repo_path.joinpath("src", "main.cpp")
@@ -280,8 +336,7 @@ def test_git_path_build_has_absolutely_no_respect_to_lock_file(
         ],
     )
 
-    built_packages = list(tmp_pixi_workspace.glob("*.conda"))
-    assert built_packages
+    assert count_matching(tmp_pixi_workspace, ".conda") > 0
 
     # lock file should remain untouched when running `pixi build`
     assert extract_git_sources(lock_path) == initial_sources
@@ -292,23 +347,10 @@ def test_git_path_build_has_absolutely_no_respect_to_lock_file(
     target_phrase = b"Build backend works v2"
     legacy_phrase = b"Build backend works on main branch"
 
-    def iter_candidate_files() -> Iterator[Path]:
-        for path in work_dir.rglob("*"):
-            if not path.is_file():
-                continue
-            if path.suffix in {".o", ".bin", ".txt", ".json"} or "simple-app" in path.name:
-                yield path
-
-    found = []
-    for candidate in iter_candidate_files():
-        try:
-            data = candidate.read_bytes()
-        except OSError:
-            continue
-        if target_phrase in data:
-            found.append(candidate)
-        assert legacy_phrase not in data, f"found legacy string in {candidate}"
+    legacy_hits = _files_containing_phrase(work_dir, legacy_phrase)
+    assert not legacy_hits, f"found legacy string in {legacy_hits}"
 
+    found = _files_containing_phrase(work_dir, target_phrase)
     assert found, "expected build artifacts to include updated branch contents"
 
 
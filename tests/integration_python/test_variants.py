@@ -5,7 +5,12 @@ import rattler
 import tomli_w
 import tomllib
 
-from .common import CURRENT_PLATFORM, copytree_with_local_backend, verify_cli_command
+from .common import (
+    CURRENT_PLATFORM,
+    copytree_with_local_backend,
+    list_conda_packages,
+    verify_cli_command,
+)
 
 
 @pytest.mark.parametrize(
@@ -45,10 +50,8 @@ def test_inline_variants_produce_multiple_outputs(
     assert not output_dir.joinpath(CURRENT_PLATFORM).exists()
 
     # Ensure that exactly two conda packages have been built
-    built_packages = list(output_dir.glob("*.conda"))
+    built_packages = list_conda_packages(output_dir)
     assert len(built_packages) == 2
-    for package in built_packages:
-        assert package.exists()
 
 
 @pytest.mark.parametrize(
@@ -132,7 +135,7 @@ def test_variant_files_produce_multiple_outputs(
         ],
     )
 
-    built_packages = list(output_dir.glob("*.conda"))
+    built_packages = list_conda_packages(output_dir)
 
     # On unix, the variant has three entries, on windows only two
     if rattler.Platform.current().is_unix: